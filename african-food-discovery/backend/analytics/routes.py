@@ -4,7 +4,7 @@ Event tracking for user behavior
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 
 router = APIRouter()
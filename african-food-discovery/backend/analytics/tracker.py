@@ -0,0 +1,67 @@
+"""
+Analytics event batching
+Buffers events in-process and writes them to Postgres in bulk
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import insert
+
+from database import engine
+import models
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+FLUSH_INTERVAL = 0.1  # seconds
+
+_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+
+
+async def track_event(event: dict):
+    """
+    Queue one analytics event (column name -> value).
+    The background flusher writes it in bulk - callers never wait on
+    the database.
+    """
+    await _queue.put(event)
+
+
+async def _flush(batch):
+    async with engine.begin() as conn:
+        await conn.execute(insert(models.AnalyticsEvent), batch)
+
+
+async def flush_analytics():
+    """
+    Background task started in the app lifespan. Drains the queue into
+    multi-row INSERTs of up to BATCH_SIZE rows (or whatever arrived
+    within FLUSH_INTERVAL), amortizing the network round trip and WAL
+    fsync that a per-event commit would pay every time.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            batch = [await _queue.get()]
+            deadline = loop.time() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await _flush(batch)
+            except Exception:
+                logger.exception("Failed to flush %d analytics events", len(batch))
+    except asyncio.CancelledError:
+        # Shutdown: write whatever is still buffered
+        batch = []
+        while not _queue.empty():
+            batch.append(_queue.get_nowait())
+        if batch:
+            await _flush(batch)
+        raise
@@ -0,0 +1,90 @@
+"""
+Shared authentication dependencies
+JWT verification with short-lived process-local caches
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import get_db
+import models
+
+bearer_scheme = HTTPBearer()
+
+# Process-local caches: token hash -> decoded payload, user id -> User
+# Short TTLs bound staleness after logout or permission changes
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> models.User:
+    """
+    Resolve the authenticated user from a bearer JWT.
+
+    Signature verification and the user lookup are cached for a few
+    seconds, keyed on a hash of the token (never the raw token), so
+    repeat requests with the same token skip the HMAC check and the
+    users SELECT entirely.
+    """
+    token = creds.credentials
+    token_key = hashlib.sha256(token.encode()).digest()[:16]
+
+    payload = _token_cache.get(token_key)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            )
+        except jwt.PyJWTError:
+            raise _unauthorized("Invalid or expired token")
+        _token_cache[token_key] = payload
+
+    # jwt.decode enforces exp, but a cached payload can outlive it -
+    # re-check the claim so a hit never extends a token's lifetime
+    expires_at = payload.get("exp")
+    if expires_at is not None and expires_at < time.time():
+        _token_cache.pop(token_key, None)
+        raise _unauthorized("Invalid or expired token")
+
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise _unauthorized("Invalid token payload")
+
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await db.get(models.User, user_id)
+        if user is not None:
+            _user_cache[user_id] = user
+    if user is None or user.deleted_at is not None:
+        raise _unauthorized("User not found")
+
+    # Logout sets token_invalidated_at - reject tokens issued before it
+    if user.token_invalidated_at is not None:
+        issued_at = payload.get("iat")
+        if issued_at is None or (
+            datetime.fromtimestamp(issued_at, tz=timezone.utc)
+            < user.token_invalidated_at
+        ):
+            raise _unauthorized("Token has been revoked")
+
+    return user
@@ -4,7 +4,7 @@ Handles user signup, login, token refresh
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 
 router = APIRouter()
@@ -0,0 +1,20 @@
+"""
+Password hashing helpers
+Argon2id via passlib, tuned to the per-login CPU budget
+"""
+
+from passlib.context import CryptContext
+
+# Argon2id dispatches to the SIMD-accelerated argon2-cffi backend.
+# memory_cost is in KiB (64 MiB); deprecated="auto" transparently
+# rehashes any legacy bcrypt hashes on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=65536,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+hash_password = pwd_context.hash
+verify_password = pwd_context.verify
@@ -3,39 +3,60 @@ Configuration settings for the application
 Load from environment variables
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
-import os
 
 class Settings(BaseSettings):
     # Database Configuration
-    DATABASE_URL: str = os.getenv(
-        "DATABASE_URL",
-        "postgresql://postgres@localhost:5432/african_food_us"
-    )
-    
+    # (BaseSettings reads the environment itself - plain defaults only)
+    DATABASE_URL: str = "postgresql+asyncpg://postgres@localhost:5432/african_food_us"
+
+    # Set True when DATABASE_URL points at PgBouncer (port 6432) -
+    # the pooler owns the connections, so the app must not pool on top
+    # of it and asyncpg's prepared statements must be disabled
+    # (transaction pooling breaks them)
+    DB_USE_PGBOUNCER: bool = False
+
+    # Connection pool tuning (per worker: size + overflow concurrent sessions)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # recycle connections before server closes them
+
     # JWT Security Configuration
-    SECRET_KEY: str = os.getenv(
-        "SECRET_KEY",
-        "change-this-to-a-long-random-string-in-production"
-    )
+    SECRET_KEY: str = "change-this-to-a-long-random-string-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
+
     # Cloudinary Configuration (for image uploads)
-    CLOUDINARY_CLOUD_NAME: str = os.getenv("CLOUDINARY_CLOUD_NAME", "")
-    CLOUDINARY_API_KEY: str = os.getenv("CLOUDINARY_API_KEY", "")
-    CLOUDINARY_API_SECRET: str = os.getenv("CLOUDINARY_API_SECRET", "")
-    
+    CLOUDINARY_CLOUD_NAME: str = ""
+    CLOUDINARY_API_KEY: str = ""
+    CLOUDINARY_API_SECRET: str = ""
+
     # Application Settings
     APP_NAME: str = "African Food Discovery Platform"
-    DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
-    ALLOWED_ORIGINS: str = os.getenv(
-        "ALLOWED_ORIGINS",
-        "http://localhost:5173,http://localhost:3000"
-    )
-    
+    DEBUG: bool = True
+    # Create tables at startup (DEBUG only) - deployments use init_db.py
+    AUTO_CREATE_TABLES: bool = True
+    # Comma-separated lists (split at the use site)
+    ALLOWED_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
+    # Host header allow-list; set to the real domain(s) in production
+    ALLOWED_HOSTS: str = "localhost,127.0.0.1"
+
+    # Response cache backend; empty falls back to in-process caching
+    REDIS_URL: str = ""
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Cached Settings factory - the .env file and environment are parsed
+    once per process. Also usable as Depends(get_settings) in routes.
+    """
+    return Settings()
+
+settings = get_settings()
@@ -1,39 +1,65 @@
 """
 Database connection and session management
-SQLAlchemy setup for PostgreSQL
+Async SQLAlchemy setup for PostgreSQL (asyncpg driver)
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from config import settings
 
-# Create database engine
-engine = create_engine(
+_connect_args = {
+    "server_settings": {
+        "application_name": "find-chow",
+        "jit": "off"
+    }
+}
+
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer (transaction mode) is the real pool - don't pool on
+    # top of it, and disable asyncpg's prepared-statement caches since
+    # the pooler hands each transaction a different backend
+    _pool_kwargs = {"poolclass": NullPool}
+    _connect_args["statement_cache_size"] = 0
+    _connect_args["prepared_statement_cache_size"] = 0
+else:
+    _pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # Prepared statements let Postgres skip parse/plan on repeat
+    # queries - a large share of a simple SELECT's server-side cost
+    _connect_args["statement_cache_size"] = 500
+    _connect_args["prepared_statement_cache_size"] = 500
+
+# Create async database engine
+engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=False,  # Logging every statement is too expensive on the hot path
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,
-    max_overflow=20
+    insertmanyvalues_page_size=1000,  # Matches the analytics flush batch
+    connect_args=_connect_args,
+    **_pool_kwargs
 )
 
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
+# Create async session factory
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
 )
 
 # Base class for all models
 Base = declarative_base()
 
 # Dependency to get database session
-def get_db():
+async def get_db():
     """
     Dependency injection for database session
-    Usage: def my_route(db: Session = Depends(get_db)):
+    Usage: async def my_route(db: AsyncSession = Depends(get_db)):
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
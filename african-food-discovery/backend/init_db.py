@@ -3,13 +3,102 @@ Initialize database - Create all tables
 Run this once to set up the database schema
 """
 
+import asyncio
+from datetime import date
+
+from sqlalchemy import text
+
 from database import engine
 import models
 
-def init_db():
+# Keeps places.location (geography) in sync with latitude/longitude so
+# radius search can use the GiST index instead of per-row haversine.
+# One statement per string: asyncpg prepares every statement, and
+# Postgres rejects multi-command prepared statements.
+PLACE_LOCATION_TRIGGER = (
+    """
+CREATE OR REPLACE FUNCTION sync_place_location() RETURNS trigger AS $$
+BEGIN
+    IF NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL THEN
+        NEW.location := ST_SetSRID(
+            ST_MakePoint(NEW.longitude, NEW.latitude), 4326
+        )::geography;
+    ELSE
+        NEW.location := NULL;
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql
+""",
+    "DROP TRIGGER IF EXISTS trg_place_location ON places",
+    """
+CREATE TRIGGER trg_place_location
+    BEFORE INSERT OR UPDATE OF latitude, longitude ON places
+    FOR EACH ROW EXECUTE FUNCTION sync_place_location()
+""",
+)
+
+# Maintains the denormalized places.rating / places.review_count so
+# reads never aggregate over the reviews table. One statement per
+# string, same constraint as PLACE_LOCATION_TRIGGER.
+PLACE_RATING_TRIGGER = (
+    """
+CREATE OR REPLACE FUNCTION update_place_rating() RETURNS trigger AS $$
+DECLARE
+    target_place_id INT := COALESCE(NEW.place_id, OLD.place_id);
+BEGIN
+    UPDATE places SET
+        review_count = (
+            SELECT COUNT(*) FROM reviews
+            WHERE place_id = target_place_id
+              AND approved AND deleted_at IS NULL
+        ),
+        rating = (
+            SELECT COALESCE(AVG(rating), 0) FROM reviews
+            WHERE place_id = target_place_id
+              AND approved AND deleted_at IS NULL
+        )
+    WHERE id = target_place_id;
+    RETURN COALESCE(NEW, OLD);
+END $$ LANGUAGE plpgsql
+""",
+    "DROP TRIGGER IF EXISTS trg_place_rating ON reviews",
+    """
+CREATE TRIGGER trg_place_rating
+    AFTER INSERT OR UPDATE OR DELETE ON reviews
+    FOR EACH ROW EXECUTE FUNCTION update_place_rating()
+""",
+)
+
+def analytics_partitions(months_ahead: int = 3):
+    """
+    DDL for monthly analytics_events partitions, current month plus a
+    few ahead. Re-run init_db.py (cron or pg_partman in production) to
+    keep rolling partitions available; dropping an old month is a
+    plain DROP TABLE.
+    """
+    year, month = date.today().year, date.today().month
+    statements = []
+    for _ in range(months_ahead + 1):
+        start = date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        end = date(year, month, 1)
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS analytics_events_{start:%Y_%m} "
+            f"PARTITION OF analytics_events "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    return statements
+
+async def init_db():
     """Create all database tables"""
-    models.Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await conn.run_sync(models.Base.metadata.create_all)
+        for ddl in analytics_partitions():
+            await conn.execute(text(ddl))
+        for ddl in PLACE_LOCATION_TRIGGER + PLACE_RATING_TRIGGER:
+            await conn.execute(text(ddl))
     print("✅ Database tables created successfully!")
 
 if __name__ == "__main__":
-    init_db()
+    asyncio.run(init_db())
@@ -4,11 +4,13 @@ Defines all database tables
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Float, Boolean, DateTime, 
-    Text, ForeignKey, Enum as SQLEnum
+    Column, Integer, BigInteger, Identity, String, Float, Boolean,
+    DateTime, Text, ForeignKey, Enum as SQLEnum, Index, text, Computed,
+    func, UniqueConstraint
 )
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from geoalchemy2 import Geography
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from database import Base
 
 # ============================================
@@ -31,9 +33,10 @@ class User(Base):
     preferred_language = Column(String, default="en")
     reputation_score = Column(Integer, default=0)
     verified_shopper = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)
+    token_invalidated_at = Column(DateTime(timezone=True), nullable=True)  # Set on logout; older tokens rejected
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     reviews = relationship("Review", back_populates="user", cascade="all, delete-orphan")
@@ -46,7 +49,20 @@ class User(Base):
 
 class Place(Base):
     __tablename__ = "places"
-    
+    __table_args__ = (
+        # Covers GET /places?city=...&place_type=... for live rows only
+        Index(
+            "ix_place_city_type_active", "city", "place_type",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        # GIN makes delivery_services.contains(["DoorDash"]) an index lookup
+        Index(
+            "ix_place_delivery_services_gin", "delivery_services",
+            postgresql_using="gin"
+        ),
+        Index("ix_place_location_gist", "location", postgresql_using="gist"),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False, index=True)
     description = Column(Text)
@@ -57,6 +73,11 @@ class Place(Base):
     country = Column(String, default="US")
     latitude = Column(Float)
     longitude = Column(Float)
+    # Spatial point kept in sync from lat/lng; radius search uses
+    # func.ST_DWithin(Place.location, point, radius_m) on the GiST index
+    location = Column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False)
+    )
     phone = Column(String)
     website_url = Column(String)
     whatsapp_number = Column(String)
@@ -64,13 +85,13 @@ class Place(Base):
     place_type = Column(String)  # grocery, restaurant, butcher, bakery, market
     specialization = Column(String)  # West African, East African, Pan-African
     description_short = Column(Text)
-    languages_spoken = Column(Text)  # JSON: ["English", "Yoruba", "Spanish"]
+    languages_spoken = Column(JSONB)  # ["English", "Yoruba", "Spanish"]
     accepts_cash = Column(Boolean, default=True)
     accepts_card = Column(Boolean, default=True)
     accepts_mobile_payment = Column(Boolean, default=False)
     has_parking = Column(Boolean, default=False)
     delivery_available = Column(Boolean, default=False)
-    delivery_services = Column(Text)  # JSON: ["DoorDash", "UberEats"]
+    delivery_services = Column(JSONB)  # ["DoorDash", "UberEats"]
     delivery_notes = Column(String)  # Free delivery, minimum order, etc
     
     # Hours (HH:MM-HH:MM format, e.g., "09:00-21:00")
@@ -90,14 +111,16 @@ class Place(Base):
     owner_name = Column(String)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    products = relationship("PlaceProduct", back_populates="place", cascade="all, delete-orphan")
-    reviews = relationship("Review", back_populates="place", cascade="all, delete-orphan")
-    qa = relationship("QA", back_populates="place", cascade="all, delete-orphan")
+    # lazy="raise" so an accidental lazy load fails loudly instead of
+    # silently issuing N+1 queries - routes must selectinload these
+    products = relationship("PlaceProduct", back_populates="place", cascade="all, delete-orphan", lazy="raise")
+    reviews = relationship("Review", back_populates="place", cascade="all, delete-orphan", lazy="raise")
+    qa = relationship("QA", back_populates="place", cascade="all, delete-orphan", lazy="raise")
     favorites = relationship("Favorite", back_populates="place", cascade="all, delete-orphan")
 
 # ============================================
@@ -106,29 +129,45 @@ class Place(Base):
 
 class Product(Base):
     __tablename__ = "products"
-    
+    __table_args__ = (
+        # Full-text search over name/keywords/alternative names
+        Index("ix_product_tsv", "search_tsv", postgresql_using="gin"),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False, index=True)
     description = Column(Text)
     category = Column(String)  # grains, spices, proteins, produce, pantry
     cuisine_region = Column(String)  # West African, East African, Southern African
     english_name = Column(String)
-    alternative_names = Column(Text)  # JSON: ["Gari", "Fermented cassava"]
+    alternative_names = Column(JSONB)  # ["Gari", "Fermented cassava"]
     spanish_name = Column(String)
     brand = Column(String)
     origin_country = Column(String)  # Ghana, Nigeria, Cameroon, etc
     image_url = Column(String)
     image_thumbnail_url = Column(String)
     search_keywords = Column(Text)  # For SEO: "cassava, gari, flour"
-    
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)
+    # Generated in Postgres; query with
+    # Product.search_tsv.op("@@")(func.plainto_tsquery("english", q))
+    search_tsv = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(name,'') || ' ' || "
+            "coalesce(search_keywords,'') || ' ' || "
+            "coalesce(alternative_names::text,''))",
+            persisted=True
+        )
+    )
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    places = relationship("PlaceProduct", back_populates="product", cascade="all, delete-orphan")
-    reviews = relationship("Review", back_populates="product", cascade="all, delete-orphan")
-    qa = relationship("QA", back_populates="product", cascade="all, delete-orphan")
+    # lazy="raise": see Place - eager-load with selectinload in routes
+    places = relationship("PlaceProduct", back_populates="product", cascade="all, delete-orphan", lazy="raise")
+    reviews = relationship("Review", back_populates="product", cascade="all, delete-orphan", lazy="raise")
+    qa = relationship("QA", back_populates="product", cascade="all, delete-orphan", lazy="raise")
     favorites = relationship("Favorite", back_populates="product", cascade="all, delete-orphan")
 
 # ============================================
@@ -137,20 +176,28 @@ class Product(Base):
 
 class PlaceProduct(Base):
     __tablename__ = "place_products"
-    
-    id = Column(Integer, primary_key=True)
-    place_id = Column(Integer, ForeignKey("places.id"), nullable=False, index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    __table_args__ = (
+        # Covers "which places carry product X" joins
+        # (supersedes a single-column index on product_id)
+        Index("ix_placeproduct_product_place", "product_id", "place_id"),
+        # One inventory row per place/product pair; the backing unique
+        # index also covers place_id lookups
+        UniqueConstraint("place_id", "product_id", name="uq_place_product"),
+    )
+
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    place_id = Column(Integer, ForeignKey("places.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     
     # Availability (not real-time, just "commonly available here?")
     commonly_available = Column(Boolean, default=True)
     typical_price = Column(Float)
     currency = Column(String, default="USD")
     notes = Column(String)  # "Fresh on weekends", "Frozen only", etc
-    last_verified_at = Column(DateTime)
+    last_verified_at = Column(DateTime(timezone=True))
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     place = relationship("Place", back_populates="products")
@@ -162,10 +209,15 @@ class PlaceProduct(Base):
 
 class Review(Base):
     __tablename__ = "reviews"
-    
-    id = Column(Integer, primary_key=True)
+    __table_args__ = (
+        # Covers GET /places/{id}/reviews ORDER BY created_at DESC
+        # (supersedes a single-column index on place_id)
+        Index("ix_review_place_created", "place_id", "created_at"),
+    )
+
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    place_id = Column(Integer, ForeignKey("places.id"), nullable=False, index=True)
+    place_id = Column(Integer, ForeignKey("places.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True)
     
     # Review content
@@ -179,7 +231,7 @@ class Review(Base):
     freshness_rating = Column(String)  # Fresh today, Looks good, Older stock
     
     # Media
-    photos = Column(Text)  # JSON array of URLs
+    photos = Column(JSONB)  # Array of photo URLs
     photo_count = Column(Integer, default=0)
     
     # Engagement
@@ -193,11 +245,11 @@ class Review(Base):
     
     # Owner response
     owner_response = Column(Text)
-    owner_response_date = Column(DateTime)
+    owner_response_date = Column(DateTime(timezone=True))
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="reviews")
@@ -211,7 +263,7 @@ class Review(Base):
 class QA(Base):
     __tablename__ = "qa"
     
-    id = Column(Integer, primary_key=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     place_id = Column(Integer, ForeignKey("places.id"), nullable=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True, index=True)
@@ -224,8 +276,8 @@ class QA(Base):
     answered = Column(Boolean, default=False)
     helpful_count = Column(Integer, default=0)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     user = relationship("User", back_populates="qa_questions")
@@ -240,15 +292,15 @@ class QA(Base):
 class QAAnswer(Base):
     __tablename__ = "qa_answers"
     
-    id = Column(Integer, primary_key=True)
-    qa_id = Column(Integer, ForeignKey("qa.id"), nullable=False, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    qa_id = Column(BigInteger, ForeignKey("qa.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     answer_text = Column(Text, nullable=False)
     place_verified = Column(Boolean, default=False)
     helpful_count = Column(Integer, default=0)
     unhelpful_count = Column(Integer, default=0)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     qa = relationship("QA", back_populates="answers")
@@ -259,13 +311,25 @@ class QAAnswer(Base):
 
 class Favorite(Base):
     __tablename__ = "favorites"
-    
-    id = Column(Integer, primary_key=True)
+    __table_args__ = (
+        # A user can favorite a given place or product only once;
+        # partial because place_id/product_id are mutually optional
+        Index(
+            "uq_fav_user_place", "user_id", "place_id", unique=True,
+            postgresql_where=text("place_id IS NOT NULL")
+        ),
+        Index(
+            "uq_fav_user_product", "user_id", "product_id", unique=True,
+            postgresql_where=text("product_id IS NOT NULL")
+        ),
+    )
+
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     place_id = Column(Integer, ForeignKey("places.id"), nullable=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="favorites")
@@ -278,11 +342,21 @@ class Favorite(Base):
 
 class AnalyticsEvent(Base):
     __tablename__ = "analytics_events"
-    
-    id = Column(Integer, primary_key=True)
+    __table_args__ = (
+        # Covers dashboard scans by event_type over a time range
+        # (supersedes a single-column index on event_type)
+        Index("ix_analytics_event_created", "event_type", "created_at"),
+        # Monthly range partitions - init_db.py creates them; pruning
+        # keeps dashboard scans to the months actually queried
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Sequence-backed (BIGSERIAL) rather than Identity: Postgres only
+    # allows identity columns on partitioned tables from version 17
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    
-    event_type = Column(String, nullable=False, index=True)  # product_search, place_view, click_directions
+
+    event_type = Column(String, nullable=False)  # product_search, place_view, click_directions
     search_query = Column(String)
     
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True)
@@ -293,6 +367,7 @@ class AnalyticsEvent(Base):
     location_state = Column(String)
     
     user_device = Column(String)  # mobile, desktop
-    event_data = Column(Text)  # JSON for additional context
+    event_data = Column(JSONB)  # Additional context
     
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Part of the primary key: Postgres requires the partition key in it
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True, index=True)
@@ -4,11 +4,29 @@ Handles store/restaurant listings and details
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
 from database import get_db
+from models import Place, PlaceProduct
 
 router = APIRouter()
 
+def place_detail_query():
+    """
+    Base query for place detail/list routes.
+
+    Hot relationships are lazy="raise" in models.py, so anything a
+    route returns must be eager-loaded here. selectinload fetches each
+    relationship with a single IN-list SELECT regardless of row count,
+    instead of one query per place (N+1).
+    """
+    return select(Place).options(
+        selectinload(Place.products).selectinload(PlaceProduct.product),
+        selectinload(Place.reviews),
+    )
+
 # TODO: Implement place routes
 # GET /places - List places with filters
 # GET /places/search - Search places
@@ -4,7 +4,7 @@ Handles questions, answers, and voting
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 
 router = APIRouter()
@@ -4,7 +4,7 @@ Handles review creation, display, and moderation
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 
 router = APIRouter()
@@ -4,7 +4,7 @@ Combined product and place search
 """
 
 from fastapi import APIRouter, Query, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 
 router = APIRouter()